@@ -409,6 +409,94 @@ length = remove_duplicates_sorted(arr)
 print(f"Unique elements: {arr[:length]}")
 
 
+# ────────────────────────────────────────────────────────────────────────
+# PATTERN 4: SAME KERNELS ON A MEMORY-MAPPED FILE (NO PARSING, NO COPY)
+# ────────────────────────────────────────────────────────────────────────
+
+import mmap
+import sys
+from contextlib import contextmanager
+
+@contextmanager
+def mapped_int64(path, mode="r"):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "A list of 10^9 Python ints costs ~36 GB. If the file is already packed
+    int64, I can mmap it and cast the mapping to a memoryview of 'q'.
+    Indexing it returns plain ints, len() works, and slicing returns
+    another view - so my two-pointer and sliding-window functions run on
+    it unchanged, and the OS pages data in only as it's touched."
+
+    mode: "r" read-only, "r+" writes go to the file, "c" copy-on-write
+    (in-place algorithms can modify it without touching the file; only
+    "r+" needs write permission on the file).
+
+    Slices taken inside the block stay valid after it: the mapping is
+    unmapped when the last of them is released or garbage-collected.
+    """
+    if sys.byteorder != "little":
+        # memoryview.cast uses native order; the file is little-endian
+        raise ValueError("mapped_int64 requires a little-endian host")
+
+    access = {"r": mmap.ACCESS_READ, "r+": mmap.ACCESS_WRITE,
+              "c": mmap.ACCESS_COPY}[mode]
+    with open(path, "r+b" if mode == "r+" else "rb") as f:
+        size = f.seek(0, 2)
+        if size % 8:
+            raise ValueError(f"{path}: size {size} is not a multiple of 8")
+        if size == 0:  # mmap can't map an empty file
+            yield memoryview(b"").cast("q")
+            return
+        mm = mmap.mmap(f.fileno(), 0, access=access)
+    view = memoryview(mm).cast("q")
+    try:
+        yield view
+    finally:
+        view.release()
+        try:
+            mm.close()
+        except BufferError:
+            pass  # Caller still holds slices; mm closes when they are freed
+
+def binary_search(nums, target):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Plain index-based binary search - works on a list or a mapped view.
+    On a mapped file only ~log2(n) pages are ever read."
+    """
+    left, right = 0, len(nums) - 1
+
+    while left <= right:
+        mid = (left + right) // 2
+        if nums[mid] == target:
+            return mid
+        elif nums[mid] < target:
+            left = mid + 1
+        else:
+            right = mid - 1
+
+    return -1
+
+print("\n▶ MEMORY-MAPPED INPUT PATTERN:")
+import os
+import tempfile
+from array import array
+
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, "offsets.i64")
+    with open(path, "wb") as f:
+        array("q", [1, 1, 2, 3, 3, 4, 6, 9]).tofile(f)  # Native = little-endian here
+
+    with mapped_int64(path) as view:
+        print(f"Two Sum (mapped): {two_sum_sorted(view, 10)}")
+        print(f"Max sum window 3 (mapped): {max_sum_subarray(view, 3)}")
+        print(f"binary_search(view, 6) = {binary_search(view, 6)}")
+
+    with mapped_int64(path, mode="c") as view:  # File stays untouched
+        length = remove_duplicates_sorted(view)
+        print(f"Unique (mapped): {view[:length].tolist()}")
+
+
 # ═══════════════════════════════════════════════════════════════════════
 # 9️⃣ COMPARISON WITH JAVA/JAVASCRIPT
 # ═══════════════════════════════════════════════════════════════════════
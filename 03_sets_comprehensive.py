@@ -211,6 +211,481 @@ A_copy = A.copy()
 A_copy ^= B                        # A = A ^ B
 print(f"A ^= B: {A_copy}")
 
+# 🚀 SCALING UP: a set of 10^8 ints costs ~6 GB (boxed ints + hash slots).
+# For dense-ish 32-bit IDs, a compressed bitmap gives the same operators.
+
+from array import array
+from bisect import bisect_left
+
+_BYTE_BITS = [tuple(k for k in range(8) if b >> k & 1) for b in range(256)]
+
+class RoaringBitmap:
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Roaring bitmaps split 32-bit ints by their high 16 bits into chunks
+    of 65536. A sparse chunk is a sorted array of 16-bit lows (2 bytes per
+    value); once it passes 4096 values it becomes an 8 KB bitmap, which
+    is then the smaller form. Set algebra runs chunk by chunk: bitmap
+    against bitmap is a single big-int AND/OR/XOR in C; array against
+    array is a small set operation. Results are re-packed into whichever
+    container is smaller."
+
+    Values must be ints in [0, 2**32). Supports |, &, -, ^, in, len, iter.
+    """
+    ARRAY_MAX = 4096  # Above this, a bitmap (8 KB) is smaller than an array
+
+    def __init__(self, values=()):
+        self.chunks = {}  # high 16 bits -> array('H') or int bitmap
+        # Build unboxed: lows go into a per-chunk array('H') (repeats
+        # allowed), which turns into an 8 KB bytearray bitmap once it
+        # outgrows ARRAY_MAX - so no chunk ever costs more than ~8 KB.
+        pending = {}
+        for x in values:
+            self._check(x)
+            high, low = x >> 16, x & 0xFFFF
+            c = pending.get(high)
+            if c is None:
+                pending[high] = array('H', [low])
+            elif type(c) is bytearray:
+                c[low >> 3] |= 1 << (low & 7)
+            else:
+                c.append(low)
+                if len(c) > self.ARRAY_MAX:
+                    bits = bytearray(8192)
+                    for v in c:
+                        bits[v >> 3] |= 1 << (v & 7)
+                    pending[high] = bits
+        for high in sorted(pending):
+            c = pending.pop(high)
+            if type(c) is bytearray:
+                self.chunks[high] = self._pack(int.from_bytes(c, 'little'))
+            else:
+                self.chunks[high] = self._pack(array('H', sorted(set(c))))
+
+    @staticmethod
+    def _check(x):
+        if not 0 <= x < 1 << 32:
+            raise ValueError(f"{x} is outside the 32-bit range")
+
+    # ── container helpers ─────────────────────────────────────────────
+    @staticmethod
+    def _to_bitmap(lows):
+        bits = bytearray(8192)
+        for v in lows:
+            bits[v >> 3] |= 1 << (v & 7)
+        return int.from_bytes(bits, 'little')
+
+    @staticmethod
+    def _to_array(bitmap):
+        out = array('H')
+        for i, byte in enumerate(bitmap.to_bytes(8192, 'little')):
+            if byte:
+                base = i << 3
+                out.extend(base + k for k in _BYTE_BITS[byte])
+        return out
+
+    @classmethod
+    def _pack(cls, container):
+        """Pick the smaller representation; None for an empty chunk."""
+        if isinstance(container, int):
+            card = container.bit_count()
+            if card == 0:
+                return None
+            return container if card > cls.ARRAY_MAX else cls._to_array(container)
+        if not container:
+            return None
+        return cls._to_bitmap(container) if len(container) > cls.ARRAY_MAX else container
+
+    @classmethod
+    def _combine(cls, a, b, op):
+        if a is None or b is None:
+            a = a if a is not None else array('H')
+            b = b if b is not None else array('H')
+        if isinstance(a, int) or isinstance(b, int):
+            a = a if isinstance(a, int) else cls._to_bitmap(a)
+            b = b if isinstance(b, int) else cls._to_bitmap(b)
+            result = {'|': a | b, '&': a & b, '-': a & ~b, '^': a ^ b}[op]
+            return cls._pack(result)
+        sa, sb = set(a), set(b)
+        result = {'|': sa | sb, '&': sa & sb, '-': sa - sb, '^': sa ^ sb}[op]
+        return cls._pack(array('H', sorted(result)))
+
+    def _apply(self, other, op):
+        if op == '&':
+            keys = self.chunks.keys() & other.chunks.keys()
+        elif op == '-':
+            keys = self.chunks.keys()
+        else:
+            keys = self.chunks.keys() | other.chunks.keys()
+        result = RoaringBitmap()
+        for high in sorted(keys):
+            container = self._combine(self.chunks.get(high), other.chunks.get(high), op)
+            if container is not None:
+                result.chunks[high] = container
+        return result
+
+    # ── set API ────────────────────────────────────────────────────────
+    def __or__(self, other):
+        return self._apply(other, '|')
+
+    def __and__(self, other):
+        return self._apply(other, '&')
+
+    def __sub__(self, other):
+        return self._apply(other, '-')
+
+    def __xor__(self, other):
+        return self._apply(other, '^')
+
+    def add(self, x):
+        self._check(x)
+        high, low = x >> 16, x & 0xFFFF
+        c = self.chunks.get(high)
+        if c is None:
+            self.chunks[high] = array('H', [low])
+        elif isinstance(c, int):
+            self.chunks[high] = c | (1 << low)
+        else:
+            i = bisect_left(c, low)
+            if i == len(c) or c[i] != low:
+                c.insert(i, low)
+                self.chunks[high] = self._pack(c)
+
+    def discard(self, x):
+        self._check(x)
+        high, low = x >> 16, x & 0xFFFF
+        c = self.chunks.get(high)
+        if c is None:
+            return
+        if isinstance(c, int):
+            c &= ~(1 << low)
+        else:
+            i = bisect_left(c, low)
+            if i < len(c) and c[i] == low:
+                del c[i]
+        c = self._pack(c)
+        if c is None:
+            del self.chunks[high]
+        else:
+            self.chunks[high] = c
+
+    def __contains__(self, x):
+        c = self.chunks.get(x >> 16)
+        if c is None:
+            return False
+        low = x & 0xFFFF
+        if isinstance(c, int):
+            return bool(c >> low & 1)
+        i = bisect_left(c, low)
+        return i < len(c) and c[i] == low
+
+    def __len__(self):
+        return sum(c.bit_count() if isinstance(c, int) else len(c)
+                   for c in self.chunks.values())
+
+    def __iter__(self):
+        for high in sorted(self.chunks):
+            c = self.chunks[high]
+            base = high << 16
+            for low in (self._to_array(c) if isinstance(c, int) else c):
+                yield base + low
+
+    def __eq__(self, other):
+        return isinstance(other, RoaringBitmap) and list(self) == list(other)
+
+    def nbytes(self):
+        """Approximate payload size: 2 bytes per array value, 8 KB per bitmap."""
+        return sum(8192 if isinstance(c, int) else 2 * len(c)
+                   for c in self.chunks.values())
+
+    def __repr__(self):
+        preview = list(self) if len(self) <= 10 else f"{len(self)} values"
+        return f"RoaringBitmap({preview})"
+
+RA = RoaringBitmap(A)
+RB = RoaringBitmap(B)
+print(f"Roaring: A | B = {RA | RB}, A & B = {RA & RB}, "
+      f"A - B = {RA - RB}, A ^ B = {RA ^ RB}")
+segment = RoaringBitmap(range(0, 1_000_000, 3))
+print(f"Roaring segment: {len(segment)} ids in ~{segment.nbytes() // 1024} KB")
+
+# 🚀 ORDERED SETS: set has no order, so "smallest id ≥ x", "everything in
+# [a, b]" or "what rank is this score" each cost a full sort. Java has
+# TreeSet; in Python we keep sorted chunks instead.
+
+from bisect import bisect_left, bisect_right
+
+class SortedSet:
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Python has no built-in ordered set, so I keep the values in a list of
+    sorted chunks of roughly `load` items, plus the max of each chunk.
+    Finding a value is two bisects: one over the maxes to pick the chunk,
+    one inside it. An insert only shifts items within one chunk (at most
+    2 * load), and a chunk splits when it doubles, so add/discard are
+    O(log n) plus a small bounded memmove. A Fenwick tree over the chunk
+    lengths makes rank and select O(log n) as well."
+
+    Values must be mutually comparable (all ints, all (score, name) tuples,
+    ...). Supports in, len, iter, reversed, indexing (select), |, &, -, ^,
+    and range/rank/nearest queries.
+    """
+
+    def __init__(self, iterable=(), load=1000):
+        self._load = load
+        self._build(sorted(set(iterable)))
+
+    # ── internal layout ───────────────────────────────────────────────
+    def _build(self, values):
+        """(Re)chunk an already sorted, duplicate-free list."""
+        load = self._load
+        self._chunks = [values[i:i + load] for i in range(0, len(values), load)]
+        self._maxes = [c[-1] for c in self._chunks]
+        self._len = len(values)
+        self._build_index()
+
+    def _build_index(self):
+        # Fenwick tree (1-based) over chunk lengths, built in O(#chunks)
+        tree = [0] + [len(c) for c in self._chunks]
+        for i in range(1, len(tree)):
+            j = i + (i & -i)
+            if j < len(tree):
+                tree[j] += tree[i]
+        self._index = tree
+
+    def _index_add(self, pos, delta):
+        tree = self._index
+        i = pos + 1
+        while i < len(tree):
+            tree[i] += delta
+            i += i & -i
+
+    def _prefix(self, pos):
+        """Number of values in chunks [0, pos)."""
+        tree = self._index
+        total = 0
+        while pos:
+            total += tree[pos]
+            pos -= pos & -pos
+        return total
+
+    def _locate(self, k):
+        """Map a 0-based rank to (chunk, offset) by descending the tree."""
+        tree = self._index
+        pos, step = 0, 1 << (len(tree) - 1).bit_length()
+        while step:
+            nxt = pos + step
+            if nxt < len(tree) and tree[nxt] <= k:
+                pos = nxt
+                k -= tree[nxt]
+            step >>= 1
+        return pos, k
+
+    def _resplit(self, lo, hi):
+        """Merge chunks [lo, hi) and split the result if it grew too big."""
+        merged = [x for chunk in self._chunks[lo:hi] for x in chunk]
+        if len(merged) > 2 * self._load:
+            half = len(merged) >> 1
+            parts = [merged[:half], merged[half:]]
+        else:
+            parts = [merged]
+        self._chunks[lo:hi] = parts
+        self._maxes[lo:hi] = [p[-1] for p in parts]
+        self._build_index()
+
+    # ── set API ────────────────────────────────────────────────────────
+    def add(self, x):
+        if not self._chunks:
+            self._build([x])
+            return
+        i = min(bisect_left(self._maxes, x), len(self._maxes) - 1)
+        chunk = self._chunks[i]
+        j = bisect_left(chunk, x)
+        if j < len(chunk) and chunk[j] == x:
+            return
+        chunk.insert(j, x)
+        self._maxes[i] = chunk[-1]
+        self._len += 1
+        if len(chunk) > 2 * self._load:
+            self._resplit(i, i + 1)
+        else:
+            self._index_add(i, 1)
+
+    def discard(self, x):
+        i = bisect_left(self._maxes, x)
+        if i == len(self._maxes):
+            return
+        chunk = self._chunks[i]
+        j = bisect_left(chunk, x)
+        if chunk[j] != x:
+            return
+        del chunk[j]
+        self._len -= 1
+        if not chunk:
+            del self._chunks[i]
+            del self._maxes[i]
+            self._build_index()
+        elif len(chunk) < self._load // 2 and len(self._chunks) > 1:
+            # Fold an underfull chunk into a neighbour
+            lo = i if i + 1 < len(self._chunks) else i - 1
+            self._resplit(lo, lo + 2)
+        else:
+            self._maxes[i] = chunk[-1]
+            self._index_add(i, -1)
+
+    def remove(self, x):
+        if x not in self:
+            raise KeyError(x)
+        self.discard(x)
+
+    def pop(self, index=-1):
+        """Remove and return the value at `index` (default: the largest)."""
+        value = self[index]
+        self.discard(value)
+        return value
+
+    def __contains__(self, x):
+        i = bisect_left(self._maxes, x)
+        if i == len(self._maxes):
+            return False
+        chunk = self._chunks[i]
+        return chunk[bisect_left(chunk, x)] == x
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for chunk in self._chunks:
+            yield from chunk
+
+    def __reversed__(self):
+        for chunk in reversed(self._chunks):
+            yield from reversed(chunk)
+
+    # ── order queries ─────────────────────────────────────────────────
+    def rank(self, x, right=False):
+        """Count of values < x (or <= x with right=True)."""
+        bisect = bisect_right if right else bisect_left
+        i = bisect(self._maxes, x)
+        if i == len(self._maxes):
+            return self._len
+        return self._prefix(i) + bisect(self._chunks[i], x)
+
+    def __getitem__(self, k):
+        """select(k): the k-th smallest value, negative k counts from the top."""
+        if k < 0:
+            k += self._len
+        if not 0 <= k < self._len:
+            raise IndexError("SortedSet index out of range")
+        i, j = self._locate(k)
+        return self._chunks[i][j]
+
+    def ceiling(self, x):
+        """Smallest value >= x, or None."""
+        i = bisect_left(self._maxes, x)
+        if i == len(self._maxes):
+            return None
+        chunk = self._chunks[i]
+        return chunk[bisect_left(chunk, x)]
+
+    def floor(self, x):
+        """Largest value <= x, or None."""
+        i = bisect_right(self._maxes, x)
+        if i < len(self._maxes):
+            chunk = self._chunks[i]
+            j = bisect_right(chunk, x)
+            if j:
+                return chunk[j - 1]
+        return self._maxes[i - 1] if i else None
+
+    def irange(self, lo=None, hi=None, inclusive=(True, True), reverse=False):
+        """Yield values between lo and hi (None = unbounded) in O(log n + k)."""
+        start = 0 if lo is None else self.rank(lo, right=not inclusive[0])
+        stop = self._len if hi is None else self.rank(hi, right=inclusive[1])
+        remaining = stop - start
+        if remaining <= 0:
+            return
+        if reverse:
+            i, j = self._locate(stop - 1)
+            while remaining:
+                piece = self._chunks[i][max(0, j + 1 - remaining):j + 1]
+                yield from reversed(piece)
+                remaining -= len(piece)
+                i -= 1
+                j = len(self._chunks[i]) - 1
+        else:
+            i, j = self._locate(start)
+            while remaining:
+                piece = self._chunks[i][j:j + remaining]
+                yield from piece
+                remaining -= len(piece)
+                i, j = i + 1, 0
+
+    # ── set algebra: one linear merge of the two sorted sequences ─────
+    def _combine(self, other, op):
+        if not isinstance(other, SortedSet):
+            other = SortedSet(other, self._load)
+        keep_a, keep_both, keep_b = {'|': (True, True, True),
+                                     '&': (False, True, False),
+                                     '-': (True, False, False),
+                                     '^': (True, False, True)}[op]
+        a, b = list(self), list(other)
+        out = []
+        i = j = 0
+        while i < len(a) and j < len(b):
+            if a[i] < b[j]:
+                if keep_a:
+                    out.append(a[i])
+                i += 1
+            elif b[j] < a[i]:
+                if keep_b:
+                    out.append(b[j])
+                j += 1
+            else:
+                if keep_both:
+                    out.append(a[i])
+                i += 1
+                j += 1
+        if keep_a:
+            out.extend(a[i:])
+        if keep_b:
+            out.extend(b[j:])
+        result = SortedSet(load=self._load)
+        result._build(out)
+        return result
+
+    def __or__(self, other):
+        return self._combine(other, '|')
+
+    def __and__(self, other):
+        return self._combine(other, '&')
+
+    def __sub__(self, other):
+        return self._combine(other, '-')
+
+    def __xor__(self, other):
+        return self._combine(other, '^')
+
+    def __eq__(self, other):
+        return (isinstance(other, SortedSet) and len(self) == len(other)
+                and list(self) == list(other))
+
+    def __repr__(self):
+        preview = list(self) if len(self) <= 10 else f"{len(self)} values"
+        return f"SortedSet({preview})"
+
+from itertools import islice
+
+leaderboard = SortedSet([(1200, 'ana'), (950, 'bo'), (1430, 'cy'), (1100, 'di')])
+leaderboard.add((1300, 'ed'))
+print(f"SortedSet top 3: {list(islice(leaderboard.irange(reverse=True), 3))}")
+print(f"Scores below 1200: {leaderboard.rank((1200, ''))}, "
+      f"median: {leaderboard[len(leaderboard) // 2]}, "
+      f"first ≥ 1250: {leaderboard.ceiling((1250, ''))}")
+hits = SortedSet(range(0, 100, 7))  # request timestamps (seconds)
+print(f"Requests in (70, 100]: {list(hits.irange(70, 100, inclusive=(False, True)))}")
+print(f"SortedSet algebra: {SortedSet(A) | SortedSet(B)}, {SortedSet(A) & SortedSet(B)}")
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # 5️⃣ SET COMPARISON METHODS
@@ -311,6 +786,196 @@ print("\n▶ FIND DUPLICATES:")
 print(f"[1,2,3,1] has duplicate: {contains_duplicate([1,2,3,1])}")
 print(f"[1,2,3,4] has duplicate: {contains_duplicate([1,2,3,4])}")
 
+# 🚨 Both versions keep every element in a set. For billions of IDs, trade
+# exactness for a fixed memory budget with a probabilistic filter.
+
+import random
+from hashlib import blake2b
+
+def _hash_pair(item):
+    """Two independent 64-bit hashes of item (stable across processes)."""
+    if isinstance(item, bytes):
+        data = item
+    elif isinstance(item, str):
+        data = item.encode()
+    else:
+        data = repr(item).encode()
+    digest = int.from_bytes(blake2b(data, digest_size=16).digest(), 'little')
+    return digest & 0xFFFFFFFFFFFFFFFF, (digest >> 64) | 1
+
+class BloomFilter:
+    """
+    🎤 INTERVIEWER NARRATION:
+    "A Bloom filter is a bit array plus k hash functions. add() sets k
+    bits; 'in' checks them. It never says no for something it has seen,
+    but can say yes for something it hasn't, with probability ~p.
+    For n items and target p it needs m = -n*ln(p)/ln(2)^2 bits -
+    about 1.2 bytes per item at 1% - no matter how big the items are."
+
+    max_bytes caps the bit array; the false-positive rate then rises.
+    """
+
+    def __init__(self, capacity, error_rate=0.01, max_bytes=None):
+        import math
+
+        bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        if max_bytes is not None:
+            bits = min(bits, max_bytes * 8)
+        self.size = max(bits, 8)
+        self.hashes = max(1, round(self.size / max(capacity, 1) * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        h1, h2 = _hash_pair(item)
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, item):
+        """Add item; returns True if it was (probably) already present."""
+        present = True
+        for pos in self._positions(item):
+            mask = 1 << (pos & 7)
+            if not self.bits[pos >> 3] & mask:
+                present = False
+                self.bits[pos >> 3] |= mask
+        return present
+
+    def __contains__(self, item):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7))
+                   for pos in self._positions(item))
+
+class CuckooFilter:
+    """
+    🎤 INTERVIEWER NARRATION:
+    "A cuckoo filter stores a small fingerprint of each item in one of
+    two candidate buckets (4 slots each). The second bucket is the first
+    XOR hash(fingerprint), so it can be found from either side - which
+    means I can evict ('kick') a fingerprint to its other bucket, and,
+    unlike a Bloom filter, delete items. f-bit fingerprints give a
+    false-positive rate of about 8 / 2^f."
+    """
+    SLOTS = 4
+    MAX_KICKS = 500
+
+    def __init__(self, capacity, error_rate=0.01, max_bytes=None):
+        import math
+        from array import array
+
+        self.fp_bits = min(32, max(4, math.ceil(math.log2(2 * self.SLOTS / error_rate))))
+        typecode = 'B' if self.fp_bits <= 8 else 'H' if self.fp_bits <= 16 else 'I'
+        # Power-of-two bucket count at ~95% max load
+        buckets = 1 << max(1, math.ceil(math.log2(capacity / (self.SLOTS * 0.95))))
+        itemsize = array(typecode).itemsize
+        if max_bytes is not None:
+            while buckets > 2 and buckets * self.SLOTS * itemsize > max_bytes:
+                buckets //= 2
+        self.mask = buckets - 1
+        self.table = array(typecode, bytes(buckets * self.SLOTS * itemsize))
+        self.count = 0
+
+    def _locate(self, item):
+        h1, h2 = _hash_pair(item)
+        fp = (h2 >> 1) % ((1 << self.fp_bits) - 1) + 1  # 0 means empty slot
+        i1 = h1 & self.mask
+        return fp, i1, self._alt(i1, fp)
+
+    def _alt(self, index, fp):
+        return (index ^ (fp * 0x5BD1E995)) & self.mask
+
+    def _slots(self, bucket):
+        start = bucket * self.SLOTS
+        return range(start, start + self.SLOTS)
+
+    def __contains__(self, item):
+        fp, i1, i2 = self._locate(item)
+        table = self.table
+        return any(table[s] == fp for s in self._slots(i1)) or \
+            any(table[s] == fp for s in self._slots(i2))
+
+    def add(self, item):
+        """Insert item and return True. When the filter is too full, undo
+        the kicks and return False - no resident fingerprint is lost."""
+        fp, i1, i2 = self._locate(item)
+        for bucket in (i1, i2):
+            for s in self._slots(bucket):
+                if not self.table[s]:
+                    self.table[s] = fp
+                    self.count += 1
+                    return True
+        bucket = random.choice((i1, i2))
+        kicked = []  # (slot, previous fingerprint), for rollback
+        for _ in range(self.MAX_KICKS):
+            s = random.choice(self._slots(bucket))
+            kicked.append((s, self.table[s]))
+            fp, self.table[s] = self.table[s], fp  # Evict a resident
+            bucket = self._alt(bucket, fp)
+            for s in self._slots(bucket):
+                if not self.table[s]:
+                    self.table[s] = fp
+                    self.count += 1
+                    return True
+        for s, previous in reversed(kicked):
+            self.table[s] = previous
+        return False
+
+    def discard(self, item):
+        """Remove one copy of item, if present. Only delete what you added!"""
+        fp, i1, i2 = self._locate(item)
+        for bucket in (i1, i2):
+            for s in self._slots(bucket):
+                if self.table[s] == fp:
+                    self.table[s] = 0
+                    self.count -= 1
+                    return True
+        return False
+
+def find_duplicates_approx(items, capacity, error_rate=0.01, kind='bloom',
+                           max_bytes=None, confirm=False):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Same scan as contains_duplicate, but 'seen' is a filter with a fixed
+    memory budget. Anything the filter has already seen is a candidate
+    duplicate - real, or a false positive at rate ~error_rate. If I need
+    exact answers, a second pass counts only the candidates (a small set)
+    and keeps those that really occur twice."
+
+    kind: 'bloom' or 'cuckoo'. confirm=True needs a re-iterable input
+    (list, file, ...). Returns the set of (candidate) duplicate values;
+    bool(result) answers contains_duplicate. If a cuckoo filter fills up
+    (more items than capacity, or a small max_bytes), items it cannot
+    store are reported as candidates, so duplicates are never missed.
+    """
+    if kind not in ('bloom', 'cuckoo'):
+        raise ValueError(f"kind must be 'bloom' or 'cuckoo', not {kind!r}")
+    if confirm and iter(items) is items:
+        raise TypeError("confirm=True needs a re-iterable input, not an iterator")
+
+    seen = (BloomFilter if kind == 'bloom' else CuckooFilter)(
+        capacity, error_rate, max_bytes)
+    candidates = set()
+    for item in items:
+        if kind == 'bloom':
+            if seen.add(item):
+                candidates.add(item)
+        elif item in seen or not seen.add(item):
+            candidates.add(item)  # Seen before, or the filter is full
+
+    if not confirm:
+        return candidates
+
+    counts = dict.fromkeys(candidates, 0)
+    for item in items:
+        if item in counts:
+            counts[item] += 1
+    return {item for item, n in counts.items() if n > 1}
+
+ids = [17, 4, 99, 4, 23, 17, 8]
+print(f"Bloom candidates: {find_duplicates_approx(ids, capacity=100)}")
+print(f"Cuckoo, confirmed: {find_duplicates_approx(ids, capacity=100, kind='cuckoo', confirm=True)}")
+cuckoo = CuckooFilter(capacity=100)
+cuckoo.add("user-42")
+cuckoo.discard("user-42")
+print(f"Cuckoo supports deletes: 'user-42' in filter -> {'user-42' in cuckoo}")
+
 
 # ────────────────────────────────────────────────────────────────────────
 # PATTERN 2: INTERSECTION OF ARRAYS
@@ -345,31 +1010,275 @@ print("\n▶ ARRAY INTERSECTION:")
 print(f"Intersection: {intersection([1,2,2,1], [2,2])}")
 print(f"With counts: {intersection_with_count([1,2,2,1], [2,2])}")
 
+# Follow-up: "The inputs don't fit in memory" (Grace hash join)
+def _spill_partitions(items, paths, seed, batch):
+    """Hash-partition items into files of pickled batches."""
+    import pickle
+
+    files = [open(path, 'wb') for path in paths]
+    buffers = [[] for _ in paths]
+    try:
+        for item in items:
+            p = hash((seed, item)) % len(paths)
+            buffers[p].append(item)
+            if len(buffers[p]) >= batch:
+                pickle.dump(buffers[p], files[p])
+                buffers[p].clear()
+        for f, buf in zip(files, buffers):
+            if buf:
+                pickle.dump(buf, f)
+    finally:
+        for f in files:
+            f.close()
+
+def _read_spill(path):
+    """Stream items back from a file of pickled batches."""
+    import pickle
+
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                batch = pickle.load(f)
+            except EOFError:
+                return
+            yield from batch
+
+def _count_partition(path1, path2, out_path, memory_budget, depth=0):
+    """
+    Worker task: multiset-intersect one partition pair into out_path.
+    A partition that still looks too big for the budget is split again
+    with a different hash seed (at most 3 levels deep).
+    """
+    import os
+    import pickle
+
+    small, large = sorted((path1, path2), key=os.path.getsize)
+    # A dict entry costs roughly 10x an item's pickled size
+    if os.path.getsize(small) * 10 > memory_budget and depth < 3:
+        fanout = 16
+        subs = [[f"{path}.{depth}.{i}" for i in range(fanout)] for path in (path1, path2)]
+        batch = max(100, memory_budget // (2 * fanout * 64))
+        _spill_partitions(_read_spill(path1), subs[0], depth + 1, batch)
+        _spill_partitions(_read_spill(path2), subs[1], depth + 1, batch)
+        with open(out_path, 'wb'):
+            pass
+        for i, (a, b) in enumerate(zip(*subs)):
+            part_out = f"{out_path}.{depth}.{i}"
+            _count_partition(a, b, part_out, memory_budget, depth + 1)
+            with open(out_path, 'ab') as out, open(part_out, 'rb') as part:
+                out.write(part.read())
+            for path in (a, b, part_out):
+                os.remove(path)
+        return out_path
+
+    counts = {}
+    for item in _read_spill(small):
+        counts[item] = counts.get(item, 0) + 1
+    hits = {}
+    for item in _read_spill(large):  # Only keys from the small side are kept
+        if item in counts:
+            hits[item] = hits.get(item, 0) + 1
+
+    with open(out_path, 'wb') as out:
+        pairs = [(item, min(n, counts[item])) for item, n in hits.items()]
+        for lo in range(0, len(pairs), 10_000):
+            pickle.dump(pairs[lo:lo + 10_000], out)
+    return out_path
+
+def intersection_with_count_external(items1, items2, partitions=64,
+                                     memory_budget=256 * 2**20, workers=None,
+                                     tmp_dir=None):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Two Counters need every distinct ID in RAM. Instead I hash-partition
+    both inputs to disk with the same hash, so equal IDs always land in
+    the same partition pair. Then each pair is an independent small
+    problem: count the smaller side, stream the larger side, emit
+    min(count1, count2). Pairs can run in parallel, and a pair that is
+    still too big gets re-partitioned. Memory stays around the budget."
+
+    items1, items2: iterables of hashable, picklable IDs.
+    Yields (value, count) pairs - count copies of value are in both inputs
+    (intersection_with_count would repeat value count times).
+    """
+    import os
+    import tempfile
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as spill_dir:
+        sides = [[os.path.join(spill_dir, f"{side}-{i}.pkl") for i in range(partitions)]
+                 for side in ("a", "b")]
+        batch = max(100, memory_budget // (2 * partitions * 64))
+        _spill_partitions(items1, sides[0], 0, batch)
+        _spill_partitions(items2, sides[1], 0, batch)
+
+        outs = [os.path.join(spill_dir, f"out-{i}.pkl") for i in range(partitions)]
+        budgets = [memory_budget // max(1, workers or 1)] * partitions
+        if workers and workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                done = pool.map(_count_partition, sides[0], sides[1], outs, budgets)
+                for out_path in done:
+                    yield from _read_spill(out_path)
+        else:
+            for args in zip(sides[0], sides[1], outs, budgets):
+                yield from _read_spill(_count_partition(*args))
+
+print(f"External with counts: "
+      f"{sorted(intersection_with_count_external([1,2,2,1], [2,2], partitions=4))}")
+
+# Follow-up: "Both inputs are already sorted" (posting-list intersection)
+def _gallop(arr, target, lo):
+    """First index >= lo with arr[i] >= target, probing 1, 2, 4, 8... ahead."""
+    from bisect import bisect_left
+
+    n = len(arr)
+    step, hi = 1, lo
+    while hi < n and arr[hi] < target:
+        lo = hi + 1
+        hi += step
+        step *= 2
+    return bisect_left(arr, target, lo, min(hi, n))
+
+def intersection_sorted(nums1, nums2, gallop_ratio=32):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "If both arrays are sorted, I don't need any hashing: two pointers,
+    advance whichever is smaller - O(n + m), O(1) extra space.
+    But if one list is tiny and the other huge, walking the big one is
+    wasteful. Then for each element of the small list I gallop in the big
+    one: probe 1, 2, 4, 8... ahead from the last match, then binary
+    search that window - O(small * log(big / small))."
+
+    Returns the common values once each, in sorted order.
+    """
+    if len(nums1) > len(nums2):
+        nums1, nums2 = nums2, nums1
+    result = []
+    if not nums1:
+        return result
+
+    if len(nums2) >= gallop_ratio * len(nums1):
+        j = 0
+        for x in nums1:
+            if result and result[-1] == x:
+                continue
+            j = _gallop(nums2, x, j)
+            if j == len(nums2):
+                break
+            if nums2[j] == x:
+                result.append(x)
+        return result
+
+    i = j = 0
+    while i < len(nums1) and j < len(nums2):
+        a, b = nums1[i], nums2[j]
+        if a < b:
+            i += 1
+        elif b < a:
+            j += 1
+        else:
+            if not result or result[-1] != a:
+                result.append(a)
+            i += 1
+            j += 1
+    return result
+
+def intersection_sorted_many(lists):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "For k lists I start with the shortest one - the answer can't be
+    bigger than it - and intersect it with the others in increasing
+    length order. The running result only shrinks, so later steps get
+    cheaper and mostly gallop, and I can stop as soon as it's empty."
+    """
+    if not lists:
+        return []
+    ordered = sorted(lists, key=len)
+    result = intersection_sorted(ordered[0], ordered[0])  # Dedup the seed
+    for other in ordered[1:]:
+        if not result:
+            break
+        result = intersection_sorted(result, other)
+    return result
+
+print(f"Sorted merge: {intersection_sorted([1, 2, 2, 4, 7], [2, 2, 3, 4, 8])}")
+print(f"Galloping: {intersection_sorted([5, 500, 900], list(range(0, 1000, 5)))}")
+print(f"k-way: {intersection_sorted_many([[1, 3, 5, 7, 9], [3, 5, 9], [0, 3, 9, 12]])}")
+
 
 # ────────────────────────────────────────────────────────────────────────
 # PATTERN 3: VISITED TRACKING (GRAPH PROBLEMS)
 # ────────────────────────────────────────────────────────────────────────
 
+# For a grid, every possible cell is known up front, so a bitset can
+# replace the set of (r, c) tuples (same class as in 02_tuples_comprehensive.py)
+
+class GridBitset:
+    """
+    🎤 INTERVIEWER NARRATION:
+    "A set of (r, c) tuples costs 100+ bytes per visited cell: the tuple,
+    its ints and the hash slot. For a grid I know every possible cell up
+    front, so visited can be one bit per cell in a bytearray, indexed by
+    the flat position r * cols + c. It keeps the set API - add() and
+    'in' - so it's a drop-in replacement, but it is ~800x smaller."
+
+    Cells are (r, c) tuples or flat int indices. Out-of-range tuples are
+    simply 'not in' the set, so bounds can be checked after membership.
+    """
+    __slots__ = ('rows', 'cols', 'bits', 'count')
+
+    def __init__(self, rows, cols):
+        self.rows, self.cols = rows, cols
+        self.bits = bytearray((rows * cols + 7) // 8)
+        self.count = 0
+
+    def _flat(self, cell):
+        if isinstance(cell, int):
+            return cell if 0 <= cell < self.rows * self.cols else -1
+        r, c = cell
+        return r * self.cols + c if 0 <= r < self.rows and 0 <= c < self.cols else -1
+
+    def add(self, cell):
+        i = self._flat(cell)
+        if i < 0:
+            raise IndexError(f"cell {cell!r} outside {self.rows}x{self.cols} grid")
+        mask = 1 << (i & 7)
+        if not self.bits[i >> 3] & mask:
+            self.bits[i >> 3] |= mask
+            self.count += 1
+
+    def __contains__(self, cell):
+        i = self._flat(cell)
+        return i >= 0 and bool(self.bits[i >> 3] & (1 << (i & 7)))
+
+    mark = add
+    test = __contains__
+
+    def __len__(self):
+        return self.count
+
 def num_islands_bfs(grid):
     """
     🎤 INTERVIEWER NARRATION:
-    "I'll use BFS with a set to track visited cells. Sets give us O(1)
-    lookup to check if we've visited a cell, and we can store (row, col)
-    tuples directly."
+    "I'll use BFS and track visited cells. A set of (row, col) tuples
+    gives O(1) lookup; a GridBitset gives the same O(1) add / 'in' with
+    one bit per cell instead of a stored tuple."
     """
     if not grid:
         return 0
     
     rows, cols = len(grid), len(grid[0])
-    visited = set()
+    visited = GridBitset(rows, cols)
     count = 0
     
+    from collections import deque
+
     def bfs(r, c):
-        queue = [(r, c)]
+        queue = deque([(r, c)])  # list.pop(0) would be O(n) per pop
         visited.add((r, c))
         
         while queue:
-            row, col = queue.pop(0)
+            row, col = queue.popleft()
             
             for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
                 nr, nc = row + dr, col + dc
@@ -394,6 +1303,93 @@ grid = [
 ]
 print(f"Number of islands: {num_islands_bfs(grid)}")
 
+# Reusable grid traversal engine: BFS distance fields + iterative DFS
+_STEPS = {
+    4: ((0, 1), (1, 0), (0, -1), (-1, 0)),
+    8: ((0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)),
+}
+
+def grid_distances(grid, sources, passable=lambda v: v == '1', connectivity=4):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Multi-source BFS: I push every source at distance 0 before starting,
+    so each cell is reached first from its nearest source. One pass
+    gives the whole distance field - O(rows * cols) no matter how many
+    sources. A deque makes every pop O(1), and the visited check is just
+    'distance already set'."
+
+    sources: iterable of (r, c). Returns a rows x cols list of lists with
+    the step distance to the nearest source, or -1 if unreachable.
+    """
+    from collections import deque
+
+    rows, cols = len(grid), len(grid[0]) if grid else 0
+    dist = [[-1] * cols for _ in range(rows)]
+    queue = deque()
+    for r, c in sources:
+        if dist[r][c] == -1:
+            dist[r][c] = 0
+            queue.append((r, c))
+
+    steps = _STEPS[connectivity]
+    while queue:
+        r, c = queue.popleft()
+        d = dist[r][c] + 1
+        for dr, dc in steps:
+            nr, nc = r + dr, c + dc
+            if (0 <= nr < rows and 0 <= nc < cols and dist[nr][nc] == -1
+                    and passable(grid[nr][nc])):
+                dist[nr][nc] = d
+                queue.append((nr, nc))
+    return dist
+
+def grid_dfs(grid, start, passable=lambda v: v == '1', connectivity=4, visited=None):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Iterative DFS with an explicit stack - a snake-shaped island of a
+    million cells would blow the recursion limit with recursive DFS,
+    but a list-as-stack just grows. I mark cells when pushing, so each
+    cell is pushed at most once."
+
+    Yields the (r, c) cells of start's component. Pass a shared
+    GridBitset as visited to walk several components without revisits.
+    """
+    rows, cols = len(grid), len(grid[0])
+    visited = visited if visited is not None else GridBitset(rows, cols)
+    if start in visited or not passable(grid[start[0]][start[1]]):
+        return
+    visited.add(start)
+    stack = [start]
+    steps = _STEPS[connectivity]
+    while stack:
+        r, c = stack.pop()
+        yield r, c
+        for dr, dc in steps:
+            nr, nc = r + dr, c + dc
+            if (0 <= nr < rows and 0 <= nc < cols and (nr, nc) not in visited
+                    and passable(grid[nr][nc])):
+                visited.add((nr, nc))
+                stack.append((nr, nc))
+
+def island_sizes(grid, passable=lambda v: v == '1', connectivity=4):
+    """Sizes of every component, using grid_dfs with one shared bitset."""
+    if not grid:
+        return []
+    visited = GridBitset(len(grid), len(grid[0]))
+    return [sum(1 for _ in grid_dfs(grid, (r, c), passable, connectivity, visited))
+            for r in range(len(grid)) for c in range(len(grid[0]))
+            if (r, c) not in visited and passable(grid[r][c])]
+
+city = [
+    "..#.",
+    ".##.",
+    "....",
+]
+field = grid_distances(city, [(0, 0), (2, 3)], passable=lambda v: v == '.')
+print(f"Distance to nearest facility: {field}")
+print(f"Island sizes (4-conn): {island_sizes(grid)}, "
+      f"(8-conn): {island_sizes(grid, connectivity=8)}")
+
 
 # ────────────────────────────────────────────────────────────────────────
 # PATTERN 4: LONGEST CONSECUTIVE SEQUENCE
@@ -430,6 +1426,99 @@ print("\n▶ LONGEST CONSECUTIVE SEQUENCE:")
 print(f"Longest sequence: {longest_consecutive([100, 4, 200, 1, 3, 2])}")
 # [1, 2, 3, 4] → 4
 
+def longest_consecutive_numpy(nums):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Vectorized: np.unique sorts and dedups, then wherever the diff
+    between neighbours isn't 1, a run breaks. The distances between break
+    positions are the run lengths. O(n log n), but every step is in C."
+    """
+    import numpy as np
+
+    values = np.unique(np.asarray(nums))
+    if values.size == 0:
+        return 0
+    breaks = np.flatnonzero(np.diff(values) != 1)
+    bounds = np.concatenate(([-1], breaks, [values.size - 1]))
+    return int(np.diff(bounds).max())
+
+def longest_consecutive_uf(stream):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Union-find over values: each new number joins its x-1 and x+1
+    neighbours' sets if they exist, and the root stores the set size.
+    It works on any iterable in one pass - no sort, no second look."
+    """
+    parent = {}
+    size = {}
+
+    def find(x):
+        root = x
+        while parent[root] != root:
+            root = parent[root]
+        while parent[x] != root:
+            parent[x], x = root, parent[x]
+        return root
+
+    best = 0
+    for x in stream:
+        if x in parent:
+            continue
+        parent[x], size[x] = x, 1
+        root = x
+        for y in (x - 1, x + 1):
+            if y in parent:
+                a, b = find(root), find(y)
+                if size[a] < size[b]:
+                    a, b = b, a
+                parent[b] = a
+                size[a] += size.pop(b)
+                root = a
+        best = max(best, size[find(root)])
+    return best
+
+class ConsecutiveTracker:
+    """
+    🎤 INTERVIEWER NARRATION:
+    "For a live feed I keep only run endpoints: ends[a] = b and
+    ends[b] = a for every run [a, b]. A new x extends the run ending at
+    x-1 and/or the run starting at x+1 - two dict lookups - and those
+    inner endpoints are dropped. So add() is O(1) and longest is always
+    current."
+
+    assume_unique=True (e.g. IDs from an allocator) skips the membership
+    set, so memory is O(number of runs) instead of O(values seen).
+    """
+
+    def __init__(self, assume_unique=False):
+        self.ends = {}
+        self.seen = None if assume_unique else set()
+        self.longest = 0
+
+    def add(self, x):
+        if self.seen is not None:
+            if x in self.seen:
+                return self.longest
+            self.seen.add(x)
+        elif x in self.ends:
+            return self.longest
+
+        lo = self.ends.pop(x - 1, x)  # Start of the run ending at x-1
+        hi = self.ends.pop(x + 1, x)  # End of the run starting at x+1
+        self.ends[lo] = hi
+        self.ends[hi] = lo
+        self.longest = max(self.longest, hi - lo + 1)
+        return self.longest
+
+id_feed = [100, 4, 200, 1, 3, 2]
+try:
+    print(f"NumPy mode: {longest_consecutive_numpy(id_feed)}")
+except ImportError:
+    print("NumPy mode: (numpy not installed)")
+print(f"Union-find mode: {longest_consecutive_uf(iter(id_feed))}")
+tracker = ConsecutiveTracker()
+print(f"Incremental: {[tracker.add(x) for x in id_feed]}")
+
 
 # ────────────────────────────────────────────────────────────────────────
 # PATTERN 5: SET OPERATIONS FOR WORD PROBLEMS
@@ -459,6 +1548,205 @@ emails = [
 ]
 print(f"Unique emails: {unique_email_addresses(emails)}")
 
+# 🚀 At mailing-list scale (hundreds of millions of lines) the per-string
+# split/replace and one giant set become the bottleneck.
+
+from hashlib import blake2b
+
+_KEEP_ALL = bytes.maketrans(b'', b'')  # Identity table: translate() only deletes
+
+def _normalize_email_bytes(line):
+    """b'a.b+tag@x.com' -> b'ab@x.com' (None for blank / malformed lines)."""
+    local, at, domain = line.strip().rpartition(b'@')
+    if not at or not local:
+        return None
+    return local.partition(b'+')[0].translate(_KEEP_ALL, b'.') + b'@' + domain
+
+class HyperLogLog:
+    """
+    🎤 INTERVIEWER NARRATION:
+    "HyperLogLog estimates distinct counts in fixed memory. Hash each
+    item; the first p bits pick one of 2^p registers, and the register
+    keeps the longest run of leading zeros seen in the remaining bits -
+    a long run means many distinct items went through. The harmonic mean
+    over registers gives the estimate, with ~1.04/sqrt(2^p) relative
+    error. 2^14 registers = 16 KB for ~0.8% error, at any cardinality,
+    and two sketches merge by taking the max per register."
+    """
+
+    def __init__(self, p=14):
+        if not 4 <= p <= 18:
+            raise ValueError("p must be between 4 and 18")
+        self.p = p
+        self.registers = bytearray(1 << p)
+
+    @classmethod
+    def for_budget(cls, memory_bytes):
+        """Largest sketch (one byte per register) that fits memory_bytes."""
+        return cls(max(4, min(18, memory_bytes.bit_length() - 1)))
+
+    def add(self, item):
+        h = int.from_bytes(blake2b(item, digest_size=8).digest(), 'big')
+        rest_bits = 64 - self.p
+        index = h >> rest_bits
+        rest = h & ((1 << rest_bits) - 1)
+        rank = rest_bits - rest.bit_length() + 1  # Leading zeros + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def merge(self, other):
+        self.registers = bytearray(map(max, self.registers, other.registers))
+        return self
+
+    def count(self):
+        import math
+
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)  # Small-range correction
+        return round(estimate)
+
+def _line_aligned_ranges(path, parts):
+    """Split a file into byte ranges that start and end on line boundaries."""
+    import os
+
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts, bounds[-1]))
+            f.readline()  # Move to the start of the next line
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+def _read_emails(path, start, end, chunk_bytes):
+    """Stream normalized emails from the lines in [start, end) of a file."""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        tail = b''
+        while remaining > 0:
+            chunk = f.read(min(chunk_bytes, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            lines = (tail + chunk).split(b'\n')
+            tail = lines.pop()  # Possibly incomplete last line
+            for line in lines:
+                email = _normalize_email_bytes(line)
+                if email is not None:
+                    yield email
+        if tail:
+            email = _normalize_email_bytes(tail)
+            if email is not None:
+                yield email
+
+def _email_sketch(path, start, end, p, chunk_bytes):
+    """Worker task (hll mode): one HyperLogLog sketch for a byte range."""
+    sketch = HyperLogLog(p)
+    for email in _read_emails(path, start, end, chunk_bytes):
+        sketch.add(email)
+    return sketch
+
+def _email_spill(path, start, end, spill_paths, chunk_bytes):
+    """
+    Worker task (exact mode): route each normalized email in [start, end)
+    to a partition file by crc32, so equal emails from any range meet in
+    the same partition.
+    """
+    import zlib
+
+    parts = len(spill_paths)
+    files = [open(p, 'wb') for p in spill_paths]
+    buffers = [[] for _ in spill_paths]
+    try:
+        for email in _read_emails(path, start, end, chunk_bytes):
+            q = zlib.crc32(email) % parts
+            buffers[q].append(email)
+            if len(buffers[q]) >= 10_000:
+                files[q].write(b'\n'.join(buffers[q]) + b'\n')
+                buffers[q].clear()
+        for f, buf in zip(files, buffers):
+            if buf:
+                f.write(b'\n'.join(buf) + b'\n')
+    finally:
+        for f in files:
+            f.close()
+
+def _count_email_partition(paths):
+    """Worker task (exact mode): distinct emails in one partition."""
+    unique = set()
+    for path in paths:
+        with open(path, 'rb') as f:
+            for line in f:  # Streamed: only the set grows
+                unique.add(line.rstrip(b'\n'))
+    return len(unique)
+
+def count_unique_emails_file(path, mode='exact', workers=None,
+                             memory_budget=1 << 14, chunk_bytes=1 << 22,
+                             partitions=None, tmp_dir=None):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Same normalization as unique_email_addresses, but built for a huge
+    newline-delimited file. I work on bytes and read big chunks instead
+    of line by line. rpartition/partition replace split, and dots are
+    removed by a precompiled translate() in C. The file is cut into
+    line-aligned byte ranges, one per worker. In exact mode each worker
+    routes its emails to partition files by a stable hash, so the
+    partitions are disjoint: each one is deduplicated on its own and only
+    its count comes back - the sum is the answer, and no process ever
+    holds more than one partition's set. With mode='hll' each range builds
+    a HyperLogLog sketch (fixed memory_budget) and the sketches merge."
+
+    partitions (exact mode, default 4 * workers): raise it until one
+    partition's set fits in a worker's memory.
+    """
+    import os
+    import tempfile
+
+    parts = max(1, workers or 1)
+    ranges = _line_aligned_ranges(path, parts) or [(0, 0)]
+    pool = None
+    if parts > 1 and len(ranges) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+        pool = ProcessPoolExecutor(max_workers=parts)
+    run = pool.map if pool else lambda fn, *args: map(fn, *args)
+
+    try:
+        if mode != 'exact':
+            p = HyperLogLog.for_budget(memory_budget).p
+            sketches = list(run(_email_sketch, *zip(*[(path, a, b, p, chunk_bytes)
+                                                      for a, b in ranges])))
+            sketch = sketches[0]
+            for other in sketches[1:]:
+                sketch.merge(other)
+            return sketch.count()
+
+        partitions = partitions or 4 * parts
+        with tempfile.TemporaryDirectory(dir=tmp_dir) as spill_dir:
+            spills = [[os.path.join(spill_dir, f"r{r}-p{q}.txt") for q in range(partitions)]
+                      for r in range(len(ranges))]
+            list(run(_email_spill, [path] * len(ranges), [a for a, _ in ranges],
+                     [b for _, b in ranges], spills, [chunk_bytes] * len(ranges)))
+            return sum(run(_count_email_partition, list(zip(*spills))))
+    finally:
+        if pool:
+            pool.shutdown()
+
+import os
+import tempfile
+
+with tempfile.TemporaryDirectory() as tmp:
+    email_file = os.path.join(tmp, "emails.txt")
+    with open(email_file, "w") as f:
+        f.write("\n".join(emails) + "\n")
+    print(f"Unique emails (file, exact): {count_unique_emails_file(email_file)}")
+    print(f"Unique emails (file, HLL): {count_unique_emails_file(email_file, mode='hll')}")
+
 
 # ═══════════════════════════════════════════════════════════════════════
 # 8️⃣ COMPARISON WITH JAVA/JAVASCRIPT
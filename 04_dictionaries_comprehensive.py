@@ -331,6 +331,132 @@ print("\n▶ TWO SUM PATTERN:")
 result = two_sum([2, 7, 11, 15], 9)
 print(f"Two sum indices: {result}")
 
+# Follow-up: "Return ALL pairs" (e.g. matching offsetting ledger entries)
+def two_sum_all_pairs(nums, target):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "To get every pair I map each value to ALL indices seen so far, not
+    just the last one. When nums[j] arrives, every earlier index of its
+    complement forms a pair - duplicates included. O(n + number of pairs)."
+    """
+    seen = {}  # value -> list of indices
+    pairs = []
+    for j, num in enumerate(nums):
+        for i in seen.get(target - num, ()):
+            pairs.append((i, j))
+        seen.setdefault(num, []).append(j)
+    return pairs
+
+def two_sum_value_pairs(nums, target):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "For distinct value pairs I count first. (a, target - a) is a pair if
+    both values exist - and if they're the same value, it must occur at
+    least twice. I only emit a <= b so each pair appears once."
+    """
+    from collections import Counter
+
+    counts = Counter(nums)
+    result = []
+    for a in sorted(counts):
+        b = target - a
+        if a < b and b in counts:
+            result.append((a, b))
+        elif a == b and counts[a] > 1:
+            result.append((a, a))
+    return result
+
+def two_sum_count(nums, target, value_range=None):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "If I only need how many index pairs there are, I never build them:
+    for each number, add how many times its complement has appeared so
+    far. O(n) time, O(distinct) space, regardless of the pair count.
+    If the values are ints in a known small range [lo, hi], a counting
+    array replaces the dict: count each value, then pair count[a] with
+    count[target - a] - O(n + range), no hashing at all."
+
+    Raises ValueError if a value falls outside value_range.
+    """
+    if value_range is None:
+        seen = {}
+        total = 0
+        for num in nums:
+            total += seen.get(target - num, 0)
+            seen[num] = seen.get(num, 0) + 1
+        return total
+
+    from array import array
+
+    lo, hi = value_range
+    counts = array('q', bytes(8 * (hi - lo + 1)))
+    for num in nums:
+        if not lo <= num <= hi:  # A negative index would silently wrap
+            raise ValueError(f"{num} is outside value_range {value_range}")
+        counts[num - lo] += 1
+
+    total = 0
+    for a in range(lo, hi + 1):
+        b = target - a
+        if b < a:
+            break  # Every pair with a <= b has been counted
+        if b > hi or not counts[a - lo]:
+            continue
+        if a == b:
+            total += counts[a - lo] * (counts[a - lo] - 1) // 2
+        else:
+            total += counts[a - lo] * counts[b - lo]
+    return total
+
+def two_sum_count_numpy(nums, target, return_pairs=False):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Vectorized: np.unique gives sorted values and their counts;
+    searchsorted looks up every complement at once. Pairs with a < b
+    contribute count[a] * count[b], pairs with a == b contribute
+    C(count, 2)."
+
+    Returns the index-pair count, plus the (a, b) value pairs if asked.
+    """
+    import numpy as np
+
+    values, counts = np.unique(np.asarray(nums), return_counts=True)
+    if values.size == 0:
+        return (0, np.empty((0, 2), dtype=values.dtype)) if return_pairs else 0
+    if values.dtype.kind in 'iu' and isinstance(target, (int, np.integer)):
+        # target - values in a narrow dtype wraps (uint8: 0 - 1 == 255), so
+        # widen to int64 - or to Python ints if even int64 could overflow
+        lo, hi = int(values[0]), int(values[-1])
+        if -2**63 <= int(target) - hi and int(target) - lo < 2**63 and hi < 2**63:
+            values = values.astype(np.int64)
+        else:
+            values = values.astype(object)
+    complements = target - values
+    pos = np.searchsorted(values, complements)
+    pos_clipped = np.minimum(pos, values.size - 1)
+    found = (pos < values.size) & (values[pos_clipped] == complements)
+
+    lower = found & (values < complements)
+    same = found & (values == complements)
+    total = int((counts[lower] * counts[pos_clipped[lower]]).sum()
+                + (counts[same] * (counts[same] - 1) // 2).sum())
+    if not return_pairs:
+        return total
+    keep = lower | (same & (counts > 1))
+    return total, np.column_stack((values[keep], complements[keep]))
+
+ledger = [5, -5, 5, 0, 0, -5, 3]
+print(f"All index pairs summing to 0: {two_sum_all_pairs(ledger, 0)}")
+print(f"Value pairs: {two_sum_value_pairs(ledger, 0)}")
+print(f"Count only: {two_sum_count(ledger, 0)}, "
+      f"counting array: {two_sum_count(ledger, 0, value_range=(-5, 5))}")
+try:
+    import numpy as np
+    print(f"NumPy count: {two_sum_count_numpy(ledger, 0)}, "
+          f"uint8 [1, 255] to 0: {two_sum_count_numpy(np.array([1, 255], dtype=np.uint8), 0)}")
+except ImportError:
+    print("NumPy count: (numpy not installed)")
+
 
 # ────────────────────────────────────────────────────────────────────────
 # PATTERN 2: FREQUENCY COUNTING / ANAGRAMS
@@ -379,6 +505,168 @@ def group_anagrams_v2(words):
     
     return list(anagram_groups.values())
 
+# Follow-up: "The corpus is 200M tokens in a file" (map/shuffle/reduce)
+def _line_aligned_ranges(path, parts):
+    """Split a file into byte ranges that start and end on line boundaries."""
+    import os
+
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, parts):
+            f.seek(max(size * i // parts, bounds[-1]))
+            f.readline()  # Move to the start of the next line
+            bounds.append(min(f.tell(), size))
+    bounds.append(size)
+    return [(a, b) for a, b in zip(bounds, bounds[1:]) if b > a]
+
+def _read_words(path, start, end, chunk_bytes):
+    """Stream whitespace-separated words from bytes [start, end) of a file."""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        tail = b''
+        while remaining > 0:
+            chunk = f.read(min(chunk_bytes, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            buf = tail + chunk
+            cut = max(buf.rfind(b' '), buf.rfind(b'\n'), buf.rfind(b'\t'))
+            if cut < 0:
+                tail = buf  # No word boundary yet
+                continue
+            tail = buf[cut + 1:]
+            yield from buf[:cut].decode('utf-8').split()
+        yield from tail.decode('utf-8').split()
+
+def _anagram_map(path, start, end, spill_paths, count_only, chunk_bytes):
+    """
+    Worker task: hash-partition the words in [start, end) by signature.
+    Writes "signature word" lines, or with count_only, one pre-summed
+    "signature count" line per signature seen in this range.
+    """
+    import zlib
+
+    n = len(spill_paths)
+    files = [open(p, 'w', encoding='utf-8') for p in spill_paths]
+    buffers = [[] for _ in spill_paths]
+    counts = [{} for _ in spill_paths]
+    try:
+        for word in _read_words(path, start, end, chunk_bytes):
+            key = ''.join(sorted(word))
+            # crc32, not hash(): str hashes differ between worker processes
+            p = zlib.crc32(key.encode('utf-8')) % n
+            if count_only:
+                counts[p][key] = counts[p].get(key, 0) + 1
+            else:
+                buffers[p].append(f"{key} {word}\n")
+                if len(buffers[p]) >= 10_000:
+                    files[p].writelines(buffers[p])
+                    buffers[p].clear()
+        for f, buf, partial in zip(files, buffers, counts):
+            f.writelines(buf)
+            f.writelines(f"{key} {size}\n" for key, size in partial.items())
+    finally:
+        for f in files:
+            f.close()
+
+def _anagram_reduce(paths, count_only, out_path):
+    """
+    Worker task: group one partition from every mapper's spill file.
+    Returns the groups (or signature -> size), or writes them to out_path.
+    """
+    groups = {}
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                key, _, value = line.rstrip('\n').partition(' ')
+                if count_only:
+                    groups[key] = groups.get(key, 0) + int(value)
+                else:
+                    groups.setdefault(key, []).append(value)
+
+    if out_path is None:
+        return groups if count_only else list(groups.values())
+    with open(out_path, 'w', encoding='utf-8') as out:
+        if count_only:
+            out.writelines(f"{key}\t{size}\n" for key, size in groups.items())
+        else:
+            out.writelines(' '.join(group) + '\n' for group in groups.values())
+    return out_path
+
+def group_anagrams_file(path, out_dir=None, count_only=False, workers=None,
+                        partitions=None, chunk_bytes=1 << 22, tmp_dir=None):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Same sorted-letters key as group_anagrams, run as map/shuffle/reduce.
+    The file is cut into line-aligned byte ranges, one per worker. Each
+    mapper streams its range in big chunks and routes every word to a
+    spill file by a stable hash of its key, so all anagrams of a word
+    land in the same partition no matter which mapper saw them. Then
+    each reducer groups one partition on its own - no shared dict. In
+    count-only mode the mappers pre-sum counts per key, so only
+    (key, size) pairs cross the shuffle and no words are kept."
+
+    path: UTF-8 text with whitespace-separated words (duplicates are kept,
+    as in group_anagrams). Returns a list of groups, or with count_only a
+    dict of sorted-letters key -> group size. With out_dir, each partition
+    is written to its own shard instead (one group per line, or
+    "key<TAB>size" lines) and the shard paths are returned. Peak memory
+    per reducer is about one partition; raise partitions for big corpora.
+    """
+    import os
+    import tempfile
+
+    workers = workers or os.cpu_count() or 1
+    partitions = partitions or 4 * workers
+    ranges = _line_aligned_ranges(path, workers) or [(0, 0)]
+    if out_dir is None:
+        outs = [None] * partitions
+    else:
+        os.makedirs(out_dir, exist_ok=True)
+        suffix = 'tsv' if count_only else 'txt'
+        outs = [os.path.join(out_dir, f"anagrams-{p:05d}.{suffix}")
+                for p in range(partitions)]
+
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as spill_dir:
+        spills = [[os.path.join(spill_dir, f"m{m}-p{p}.txt") for p in range(partitions)]
+                  for m in range(len(ranges))]
+        map_args = [(path, a, b, paths, count_only, chunk_bytes)
+                    for (a, b), paths in zip(ranges, spills)]
+        reduce_args = (list(zip(*spills)), [count_only] * partitions, outs)
+
+        if workers > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(_anagram_map, *zip(*map_args)))
+                parts = list(pool.map(_anagram_reduce, *reduce_args))
+        else:
+            for args in map_args:
+                _anagram_map(*args)
+            parts = [_anagram_reduce(*args) for args in zip(*reduce_args)]
+
+    if out_dir is not None:
+        return parts
+    if count_only:
+        sizes = {}
+        for part in parts:
+            sizes.update(part)  # Partitions have disjoint keys
+        return sizes
+    return [group for part in parts for group in part]
+
+import os
+import tempfile
+
+with tempfile.TemporaryDirectory() as tmp:
+    corpus = os.path.join(tmp, "corpus.txt")
+    with open(corpus, "w") as f:
+        f.write("eat tea tan\nate nat bat\n")
+    print(f"Anagram groups (file): {sorted(group_anagrams_file(corpus, workers=1))}")
+    print(f"Group sizes (count-only): "
+          f"{sorted(group_anagrams_file(corpus, count_only=True, workers=1).items())}")
+# On a real corpus: group_anagrams_file(path, out_dir="shards/", workers=8, partitions=256)
+
 
 # ────────────────────────────────────────────────────────────────────────
 # PATTERN 3: CACHING / MEMOIZATION
@@ -419,6 +707,229 @@ def fib_cached(n):
         return n
     return fib_cached(n - 1) + fib_cached(n - 2)
 
+# Follow-up: "What about n = 10^18?" (both versions above recurse n deep)
+def fib_fast(n, mod=None):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Fast doubling. From F(k) and F(k+1) I can jump straight to
+    F(2k) = F(k) * (2*F(k+1) - F(k)) and F(2k+1) = F(k)^2 + F(k+1)^2.
+    Walking the bits of n from the top, each bit is one doubling step,
+    plus one step forward when the bit is set. That's O(log n)
+    multiplications in a plain loop - no recursion, no cache, only two
+    numbers alive. With a modulus every intermediate stays small, so
+    n = 10^18 takes ~60 steps."
+
+    Without mod the answer itself has ~0.69n bits, so exact big-int mode
+    is practical up to n in the tens of millions.
+    """
+    if n < 0:
+        raise ValueError("n must be non-negative")
+    if mod is not None and mod <= 0:
+        raise ValueError("mod must be positive")
+
+    a, b = 0, 1  # F(k), F(k+1) with k = 0
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)  # F(2k)
+        d = a * a + b * b    # F(2k+1)
+        if mod is not None:
+            c %= mod
+            d %= mod
+        if bit == '1':
+            a, b = d, c + d  # k -> 2k + 1
+            if mod is not None:
+                b %= mod
+        else:
+            a, b = c, d      # k -> 2k
+    return a if mod is None else a % mod
+
+print(f"fib_fast(10): {fib_fast(10)}, "
+      f"matches fibonacci up to 300: {all(fib_fast(i) == fibonacci(i) for i in range(301))}")
+print(f"fib_fast(10**18) mod 1e9+7: {fib_fast(10**18, 10**9 + 7)}")
+
+# 🚨 fib_cached's lru_cache(maxsize=None) never forgets: in a long-running
+# worker every distinct argument stays alive forever. (fibonacci's memo and
+# climb_stairs_recursive in 07_interview_patterns.py are per call, so they
+# are freed afterwards.) A bounded cache caps entries or bytes instead.
+from collections import namedtuple, OrderedDict
+
+CacheInfo = namedtuple('CacheInfo', 'hits misses evictions currsize nbytes')
+
+class BoundedCache:
+    """
+    🎤 INTERVIEWER NARRATION:
+    "It's still a dict, plus an eviction order. LRU is an OrderedDict:
+    move_to_end on a hit, popitem(last=False) to evict - both O(1). LFU
+    keeps frequency buckets (freq -> OrderedDict of keys) and the current
+    minimum frequency, so the victim is the oldest key in the lowest
+    bucket, also O(1). TTL stamps each entry with an expiry time; with one
+    fixed ttl, insertion order is expiry order, so expired entries are
+    popped from the front. Every entry also carries an estimated size, so
+    the cap can be a count, a byte budget, or both."
+
+    policy: 'lru', 'lfu' or 'ttl'. ttl (seconds) also works with lru/lfu,
+    where expired entries are dropped when they are next looked up.
+    sizeof(key, value) estimates an entry's bytes (shallow getsizeof by
+    default - pass a deeper estimate for nested values).
+    """
+
+    def __init__(self, maxsize=1024, policy='lru', ttl=None, max_bytes=None,
+                 sizeof=None, thread_safe=False, clock=None):
+        import sys
+        import threading
+        import time
+        from contextlib import nullcontext
+
+        if policy not in ('lru', 'lfu', 'ttl'):
+            raise ValueError(f"unknown policy {policy!r}")
+        if policy == 'ttl' and ttl is None:
+            raise ValueError("policy='ttl' needs ttl seconds")
+        if maxsize is None and max_bytes is None:
+            raise ValueError("need maxsize or max_bytes")
+
+        self.maxsize = maxsize
+        self.policy = policy
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or (lambda key, value: sys.getsizeof(key) + sys.getsizeof(value))
+        self.clock = clock or time.monotonic
+        self.lock = threading.Lock() if thread_safe else nullcontext()
+        self.entries = OrderedDict()  # key -> (value, nbytes, expires)
+        self.freq = {}                # LFU: key -> use count
+        self.buckets = {}             # LFU: use count -> OrderedDict of keys
+        self.min_freq = 0
+        self.hits = self.misses = self.evictions = self.nbytes = 0
+
+    def _remove(self, key):
+        _, nbytes, _ = self.entries.pop(key)
+        self.nbytes -= nbytes
+        if self.policy == 'lfu':
+            f = self.freq.pop(key)
+            bucket = self.buckets[f]
+            del bucket[key]
+            if not bucket:
+                del self.buckets[f]
+
+    def _bump(self, key):
+        f = self.freq[key]
+        bucket = self.buckets[f]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[f]
+            if self.min_freq == f:
+                self.min_freq = f + 1
+        self.freq[key] = f + 1
+        self.buckets.setdefault(f + 1, OrderedDict())[key] = None
+
+    def _victim(self):
+        if self.policy != 'lfu':
+            return next(iter(self.entries))  # Least recent (lru) / oldest (ttl)
+        if self.min_freq not in self.buckets:  # Stale after an expiry
+            self.min_freq = min(self.buckets)
+        return next(iter(self.buckets[self.min_freq]))
+
+    def get(self, key):
+        """Return (found, value), counting a hit or a miss."""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] <= self.clock():
+                self._remove(key)
+                self.evictions += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+            if self.policy == 'lru':
+                self.entries.move_to_end(key)
+            elif self.policy == 'lfu':
+                self._bump(key)
+            return True, entry[0]
+
+    def put(self, key, value):
+        nbytes = self.sizeof(key, value)
+        if self.maxsize == 0 or (self.max_bytes is not None and nbytes > self.max_bytes):
+            return  # Would not fit even in an empty cache
+        with self.lock:
+            if key in self.entries:  # Another thread computed it meanwhile
+                self._remove(key)
+            now = self.clock()
+            if self.policy == 'ttl':
+                while self.entries and next(iter(self.entries.values()))[2] <= now:
+                    self._remove(next(iter(self.entries)))
+                    self.evictions += 1
+            while self.entries and (
+                    (self.maxsize is not None and len(self.entries) >= self.maxsize)
+                    or (self.max_bytes is not None and self.nbytes + nbytes > self.max_bytes)):
+                self._remove(self._victim())
+                self.evictions += 1
+
+            expires = None if self.ttl is None else now + self.ttl
+            self.entries[key] = (value, nbytes, expires)
+            self.nbytes += nbytes
+            if self.policy == 'lfu':
+                self.freq[key] = 1
+                self.buckets.setdefault(1, OrderedDict())[key] = None
+                self.min_freq = 1
+
+    def info(self):
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.evictions,
+                             len(self.entries), self.nbytes)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.freq.clear()
+            self.buckets.clear()
+            self.hits = self.misses = self.evictions = self.nbytes = 0
+
+_KWARGS_MARK = object()
+
+def bounded_memo(maxsize=1024, policy='lru', ttl=None, max_bytes=None,
+                 sizeof=None, thread_safe=False):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "A drop-in for @lru_cache that is always bounded. The wrapper builds
+    a key from the arguments, asks the cache, and on a miss calls the
+    function outside the lock - so slow calls don't serialize threads and
+    recursion works. cache_info() reports hits, misses, evictions and
+    the current size, which is what I'd export as metrics."
+
+    Two threads missing the same key may both compute it; the last one
+    to finish wins. Use 'lru' for recursive DP like fib_bounded below:
+    under 'lfu' each fresh subresult has count 1 and is evicted first.
+    """
+    from functools import wraps
+
+    def decorator(func):
+        cache = BoundedCache(maxsize, policy, ttl, max_bytes, sizeof, thread_safe)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args if not kwargs else args + (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+            found, value = cache.get(key)
+            if found:
+                return value
+            value = func(*args, **kwargs)
+            cache.put(key, value)
+            return value
+
+        wrapper.cache = cache
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
+
+@bounded_memo(maxsize=64)
+def fib_bounded(n):
+    """fib_cached with a 64-entry LRU cache instead of an unbounded one."""
+    if n <= 1:
+        return n
+    return fib_bounded(n - 1) + fib_bounded(n - 2)
+
+print(f"fib_bounded(200): {fib_bounded(200) == fib_fast(200)}, {fib_bounded.cache_info()}")
+
 
 # ────────────────────────────────────────────────────────────────────────
 # PATTERN 4: GRAPH ADJACENCY LIST
@@ -479,6 +990,100 @@ nums = [1, 1, 1]
 k = 2
 print(f"Subarrays with sum {k}: {subarray_sum(nums, k)}")
 
+def _route_prefixes(chunk, offset, k, paths):
+    """
+    Mapper: write this chunk's global prefix sums, in index order, to the
+    partition files that need them. A pair (start P, end P + k) is counted
+    by owner(P + k), so each prefix goes to owner(P) as an end and to
+    owner(P + k) as a start. Entries are P << 2 | roles (1 = end, 2 = start).
+    """
+    import pickle
+    from itertools import accumulate
+
+    parts = len(paths)
+    buckets = [[] for _ in range(parts)]
+    prefixes = accumulate(chunk, initial=offset)
+    next(prefixes)  # The prefix before the chunk belongs to the previous one
+    for p in prefixes:
+        end_owner, start_owner = p % parts, (p + k) % parts
+        if end_owner == start_owner:
+            buckets[end_owner].append(p << 2 | 3)
+        else:
+            buckets[end_owner].append(p << 2 | 1)
+            buckets[start_owner].append(p << 2 | 2)
+    for path, bucket in zip(paths, buckets):
+        with open(path, 'wb') as f:
+            pickle.dump(bucket, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+def _count_prefix_partition(paths, k, seed_zero):
+    """
+    Reducer: the subarray_sum loop over one partition's entries, read
+    chunk by chunk so they stay in index order.
+    """
+    import pickle
+
+    count = 0
+    sum_freq = {0: 1} if seed_zero else {}  # Empty prefix is a start only
+    for path in paths:
+        with open(path, 'rb') as f:
+            entries = pickle.load(f)
+        for entry in entries:
+            p = entry >> 2
+            if entry & 1:
+                count += sum_freq.get(p - k, 0)
+            if entry & 2:
+                sum_freq[p] = sum_freq.get(p, 0) + 1
+    return count
+
+def subarray_sum_parallel(nums, k, workers=None, chunk_count=None, tmp_dir=None):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "The single pass counts pairs of prefix sums with P_end - P_start = k
+    and start before end. I make that a shuffle. First the chunk totals
+    give each chunk its global offset, so a mapper per chunk can produce
+    global prefixes on its own. Each pair is owned by the partition of
+    its end value P_end; the matching start is P_end - k, so every prefix
+    is routed to owner(P) as an end and to owner(P + k) as a start. Each
+    reducer then runs the usual sum_freq loop over only its entries, in
+    index order. The counting happens in parallel and the parent only
+    adds up one number per partition."
+
+    Each prefix crosses the shuffle at most twice, via temp files that
+    never pass through the parent. Partitioning needs integer prefixes,
+    so non-int input (floats, Decimals) falls back to subarray_sum, as do
+    small inputs and a single worker.
+    """
+    import os
+    import tempfile
+
+    n = len(nums)
+    workers = workers or os.cpu_count() or 1
+    chunk_count = chunk_count or workers
+    if workers <= 1 or chunk_count <= 1 or n < 2 * chunk_count:
+        return subarray_sum(nums, k)
+    if not isinstance(k, int) or not set(map(type, nums)) <= {int, bool}:
+        return subarray_sum(nums, k)
+
+    size = -(-n // chunk_count)  # Ceiling division
+    slices = [nums[lo:lo + size] for lo in range(0, n, size)]
+    offsets = [0]
+    for chunk in slices[:-1]:
+        offsets.append(offsets[-1] + sum(chunk))
+    parts = workers
+
+    from concurrent.futures import ProcessPoolExecutor
+    with tempfile.TemporaryDirectory(dir=tmp_dir) as spill_dir, \
+            ProcessPoolExecutor(max_workers=workers) as pool:
+        paths = [[os.path.join(spill_dir, f"c{c}-p{p}.pkl") for p in range(parts)]
+                 for c in range(len(slices))]
+        list(pool.map(_route_prefixes, slices, offsets, [k] * len(slices), paths))
+        counts = pool.map(_count_prefix_partition, list(zip(*paths)), [k] * parts,
+                          [p == k % parts for p in range(parts)])
+        return sum(counts)
+
+print(f"Same count via subarray_sum_parallel: {subarray_sum_parallel([1, 1, 1], 2, workers=1)}")
+# On big inputs: subarray_sum_parallel(deltas, k, workers=8)
+
 
 # ────────────────────────────────────────────────────────────────────────
 # PATTERN 6: SLIDING WINDOW + FREQUENCY MAP
@@ -154,6 +154,11 @@ def contains_duplicate_v2(nums):
         seen.add(num)
     return False
 
+# 🚀 FOLLOW-UP: "What if the stream has billions of IDs?" Both versions
+# hold every element in a set. Swap the set for a Bloom or cuckoo filter
+# with a fixed memory budget - see find_duplicates_approx in
+# 03_sets_comprehensive.py (Pattern 1).
+
 # Test
 print(f"✅ contains_duplicate([1,2,3,1]) = {contains_duplicate_v1([1,2,3,1])}")
 print(f"✅ contains_duplicate([1,2,3,4]) = {contains_duplicate_v1([1,2,3,4])}")
@@ -262,6 +267,9 @@ print("  Q: Can you do better than O(n * k log k)?")
 print("  A: Yes! Use character count as key instead of sorting.")
 print("     Build key as tuple of counts: (count_a, count_b, ..., count_z)")
 print("     This makes it O(n * k) time.")
+print("  Q: What if the corpus is a 200M-token file?")
+print("  A: Hash-partition words by key across processes, group each partition")
+print("     separately (see group_anagrams_file in 04_dictionaries_comprehensive.py)")
 
 
 # ────────────────────────────────────────────────────────────────────────
@@ -396,6 +396,136 @@ def next_greater_elements(nums):
 
 print(f"✅ next_greater([1,2,1]) = {next_greater_elements([1,2,1])}")
 
+# ────────────────────────────────────────────────────────────────────────
+# Application: Histogram Kernels (Trapping Rain Water, Largest Rectangle)
+# ────────────────────────────────────────────────────────────────────────
+
+print("\n▶ Application: Histogram Kernels + Batch API")
+
+def trap_water(height, start=0, end=None):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Two pointers from both ends. The water above a bar is capped by the
+    smaller of the tallest bars on each side, so I always move the side
+    with the smaller max - its water level is already decided.
+    O(n) time, O(1) space."
+
+    start/end select a slice of a larger buffer without copying it.
+    """
+    left = start
+    right = (len(height) if end is None else end) - 1
+    left_max = right_max = 0
+    water = 0
+
+    while left < right:
+        if height[left] < height[right]:
+            if height[left] >= left_max:
+                left_max = height[left]
+            else:
+                water += left_max - height[left]
+            left += 1
+        else:
+            if height[right] >= right_max:
+                right_max = height[right]
+            else:
+                water += right_max - height[right]
+            right -= 1
+
+    return water
+
+def largest_rectangle(heights, start=0, end=None):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Monotonic increasing stack of indices. When a shorter bar arrives,
+    every taller bar on the stack has found its right boundary, and the
+    bar below it on the stack is its left boundary. A virtual height-0
+    bar at the end flushes the stack. Each index is pushed and popped
+    once, so O(n) time."
+    """
+    end = len(heights) if end is None else end
+    stack = []
+    max_area = 0
+
+    for i in range(start, end + 1):
+        h = heights[i] if i < end else 0  # Sentinel flushes the stack
+        while stack and heights[stack[-1]] > h:
+            height = heights[stack.pop()]
+            left = stack[-1] + 1 if stack else start
+            max_area = max(max_area, height * (i - left))
+        stack.append(i)
+
+    return max_area
+
+def _histogram_chunk(kernel, buffer, offsets):
+    """Worker task: run kernel over consecutive histograms of one buffer."""
+    return [kernel(buffer, offsets[i], offsets[i + 1])
+            for i in range(len(offsets) - 1)]
+
+def histogram_batch(kernel, histograms=None, buffer=None, offsets=None,
+                    workers=None, chunk_size=1024):
+    """
+    🎤 INTERVIEWER NARRATION:
+    "Calling the kernel once per histogram pays Python call overhead per
+    item. I'll accept either a list of arrays or one flat (ragged) buffer
+    plus offsets - histogram i is buffer[offsets[i]:offsets[i+1]] - and
+    run the kernel on index ranges, so nothing is copied in serial mode.
+    With workers > 1, chunks of histograms go to a process pool, so each
+    task carries chunk_size histograms instead of one."
+
+    kernel: trap_water or largest_rectangle.
+    Returns a list with one result per histogram, in input order.
+    """
+    if histograms is not None:
+        histograms = list(histograms)  # References only - no data copied
+        n = len(histograms)
+    elif buffer is None or offsets is None:
+        raise ValueError("pass histograms, or buffer and offsets")
+    else:
+        n = len(offsets) - 1
+
+    if not workers or workers <= 1 or n <= chunk_size:
+        if histograms is not None:
+            return [kernel(h) for h in histograms]  # Each array used in place
+        return _histogram_chunk(kernel, buffer, offsets)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    tasks = []
+    for first in range(0, n, chunk_size):
+        last = min(first + chunk_size, n)
+        if histograms is not None:
+            # Flatten only this chunk into the ragged (buffer, offsets) form
+            chunk, offs = [], [0]
+            for h in histograms[first:last]:
+                chunk.extend(h)
+                offs.append(len(chunk))
+            tasks.append((chunk, offs))
+            continue
+        lo, hi = offsets[first], offsets[last]
+        # Ship only this chunk's slice, with offsets rebased to 0
+        chunk = buffer[lo:hi]
+        if isinstance(chunk, memoryview):
+            chunk = chunk.tolist()
+        tasks.append((chunk, [offsets[i] - lo for i in range(first, last + 1)]))
+
+    results = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_histogram_chunk, kernel, chunk, offs)
+                   for chunk, offs in tasks]
+        for future in futures:
+            results.extend(future.result())
+    return results
+
+print(f"✅ trap_water([0,1,0,2,1,0,1,3,2,1,2,1]) = {trap_water([0,1,0,2,1,0,1,3,2,1,2,1])}")
+print(f"✅ largest_rectangle([2,1,5,6,2,3]) = {largest_rectangle([2,1,5,6,2,3])}")
+
+bars = [[0,1,0,2,1,0,1,3,2,1,2,1], [4,2,0,3,2,5], [2,4]]
+print(f"✅ batch trap (list) = {histogram_batch(trap_water, histograms=bars)}")
+flat = [2,1,5,6,2,3, 2,4]
+print(f"✅ batch rectangle (ragged) = "
+      f"{histogram_batch(largest_rectangle, buffer=flat, offsets=[0, 6, 8])}")
+# For big batches: histogram_batch(trap_water, buffer=..., offsets=..., workers=8)
+
 recognition = """
 🎯 RECOGNIZE STACK WHEN YOU SEE:
   - "Valid parentheses"
@@ -495,6 +625,144 @@ def first_occurrence(nums, target):
 
 print(f"✅ first_occurrence([1,2,2,2,3], 2) = {first_occurrence([1,2,2,2,3], 2)}")
 
+# ────────────────────────────────────────────────────────────────────────
+# Advanced: Batched Lookups Against a Fixed Sorted Table
+# ────────────────────────────────────────────────────────────────────────
+
+print("\n▶ Advanced: SortedIndex (bulk lookups)")
+
+from bisect import bisect_left, bisect_right
+
+class SortedIndex:
+    """
+    🎤 INTERVIEWER NARRATION:
+    "When the table is fixed and lookups come in bulk, I build the index
+    once. Everything reduces to lower_bound / upper_bound: first
+    occurrence is lower_bound if it matches, last is upper_bound - 1.
+    For a batch I sort the queries first; then each search can start
+    where the previous one ended, so the scan walks the table forwards
+    instead of jumping around, and results are scattered back into the
+    caller's order.
+
+    layout='eytzinger' stores the keys in BFS order of the implicit
+    binary search tree (children of k at 2k and 2k+1), so the top
+    levels every search touches sit together in memory. In CPython the
+    default layout wins anyway, because it runs bisect in C - use
+    eytzinger as the blueprint for a compiled/array-based port."
+
+    All lookups return sorted-order indices; first/last/find return -1
+    when the key is missing.
+    """
+
+    def __init__(self, keys, layout="sorted"):
+        if layout not in ("sorted", "eytzinger"):
+            raise ValueError(f"unknown layout: {layout!r}")
+        self.keys = keys
+        self.layout = layout
+        self.n = len(keys)
+        if layout == "eytzinger":
+            self._build_eytzinger()
+
+    def _build_eytzinger(self):
+        # In-order walk of the implicit tree assigns keys in sorted order
+        n = self.n
+        self.tree = [None] * (n + 1)   # 1-indexed, BFS order
+        self.rank = [0] * (n + 1)      # tree slot -> sorted index
+        stack, k, i = [], 1, 0
+        while stack or k <= n:
+            while k <= n:
+                stack.append(k)
+                k *= 2
+            k = stack.pop()
+            self.tree[k] = self.keys[i]
+            self.rank[k] = i
+            i += 1
+            k = 2 * k + 1
+
+    def lower_bound(self, x, lo=0):
+        """First index with keys[i] >= x (n if none)."""
+        if self.layout == "sorted":
+            return bisect_left(self.keys, x, lo)
+        tree, k = self.tree, 1
+        while k <= self.n:
+            k = 2 * k + (tree[k] < x)
+        k >>= ((~k) & (k + 1)).bit_length()  # Undo the trailing right turns
+        return max(self.rank[k] if k else self.n, lo)  # Same clamp as bisect
+
+    def upper_bound(self, x, lo=0):
+        """First index with keys[i] > x (n if none)."""
+        if self.layout == "sorted":
+            return bisect_right(self.keys, x, lo)
+        tree, k = self.tree, 1
+        while k <= self.n:
+            k = 2 * k + (tree[k] <= x)
+        k >>= ((~k) & (k + 1)).bit_length()
+        return max(self.rank[k] if k else self.n, lo)
+
+    def first(self, x, lo=0):
+        i = self.lower_bound(x, lo)
+        return i if i < self.n and self.keys[i] == x else -1
+
+    def last(self, x, lo=0):
+        i = self.upper_bound(x, lo) - 1
+        return i if i >= 0 and self.keys[i] == x else -1
+
+    find = first  # Any match will do; the first one is as cheap as any
+
+    def lookup(self, queries, op="find"):
+        """
+        Answer many queries in one call. op is one of 'find', 'first',
+        'last', 'lower', 'upper'. Results come back in query order.
+
+        Queries are visited in sorted order, so the bound only moves right:
+        when keys[lo] already bounds the next query (repeats, clustered
+        queries) the answer is lo with no search at all, and otherwise the
+        sorted layout bisects only keys[lo:]. The eytzinger layout has no
+        suffix to search, so its misses descend from the root. For random
+        distinct queries the sort eats the savings and this runs about as
+        fast as a plain bisect loop; the skip only pays off on repeats.
+        """
+        if op not in ("find", "first", "last", "lower", "upper"):
+            raise ValueError(f"unknown op: {op!r}")
+        keys, n = self.keys, self.n
+        right = op in ("last", "upper")
+        if self.layout == "sorted":
+            search = bisect_right if right else bisect_left
+        else:
+            bound = self.upper_bound if right else self.lower_bound
+            search = lambda keys, x, lo: bound(x)
+
+        order = sorted(range(len(queries)), key=queries.__getitem__)
+        bounds = [0] * len(queries)
+        lo = 0
+        if right:
+            for qi in order:
+                x = queries[qi]
+                if lo < n and keys[lo] <= x:
+                    lo = search(keys, x, lo)
+                bounds[qi] = lo
+        else:
+            for qi in order:
+                x = queries[qi]
+                if lo < n and keys[lo] < x:
+                    lo = search(keys, x, lo)
+                bounds[qi] = lo
+
+        if op in ("find", "first"):
+            return [i if i < n and keys[i] == x else -1
+                    for i, x in zip(bounds, queries)]
+        if op == "last":
+            return [i - 1 if i and keys[i - 1] == x else -1
+                    for i, x in zip(bounds, queries)]
+        return bounds
+
+table = [1, 2, 2, 2, 3, 5, 8, 8, 13]
+for layout in ("sorted", "eytzinger"):
+    index = SortedIndex(table, layout=layout)
+    print(f"✅ {layout}: first(2)={index.first(2)}, last(8)={index.last(8)}, "
+          f"lower(4)={index.lower_bound(4)}, "
+          f"bulk find {[13, 2, 4, 1]} -> {index.lookup([13, 2, 4, 1])}")
+
 recognition = """
 🎯 RECOGNIZE BINARY SEARCH WHEN YOU SEE:
   - Sorted array